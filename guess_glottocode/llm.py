@@ -1,13 +1,76 @@
 import anthropic
+import asyncio
+import json
 import re
 import pandas as pd
 import keyring
+import weakref
 
-from typing import Literal
+from typing import Any, Callable, Dict, Hashable, Literal, Sequence, TypeVar
 from anthropic.types import MessageParam
 from google import genai
 
 
+T = TypeVar("T")
+
+# Prompts already built, keyed by (id(candidates), language)
+_PROMPT_CACHE: Dict[tuple[int, str], tuple[weakref.ref, tuple[str, str]]] = {}
+
+# Glottocodes of each candidates DataFrame, keyed by (id(candidates), None)
+_CANDIDATE_IDS_CACHE: Dict[tuple[int, None], tuple[weakref.ref, frozenset]] = {}
+
+# Models and sampling parameters shared by the blocking and the async requests
+ANTHROPIC_MODEL = "claude-3-opus-20240229"
+GEMINI_MODEL = "gemini-2.0-flash"
+TEMPERATURE = 0.0
+MAX_TOKENS = 4096
+
+# Characters stripped from model responses, compiled once
+NON_WORD_CHARACTERS = re.compile(r'\W+')
+
+# API keys already retrieved from the keyring, keyed by API name
+_API_KEY_CACHE: Dict[str, str] = {}
+
+
+def strip_non_word_characters(text: str) -> str:
+    """
+    Remove all characters from a model response that cannot be part of a Glottocode.
+
+    Args:
+        text (str): The raw text of the LLM's response
+
+    Returns:
+        str: The text without whitespace, punctuation and other non-word characters.
+    """
+    return NON_WORD_CHARACTERS.sub('', text)
+
+
+def anthropic_request(task: str, role: str) -> Dict[str, Any]:
+    """
+    Build the keyword arguments of an Anthropic messages request.
+
+    Args:
+        task (str): The prompt to send to the language model
+        role (str): The system prompt that defines the assistant's role or behavior
+
+    Returns:
+        Dict[str, Any]: The arguments for `messages.create`.
+    """
+    messages: list[MessageParam] = [
+        {
+            "role": "user",
+            "content": task
+        }
+    ]
+    return dict(
+        model=ANTHROPIC_MODEL,
+        system=role,
+        temperature=TEMPERATURE,
+        max_tokens=MAX_TOKENS,
+        messages=messages
+    )
+
+
 def send_task(
     task: str,
     role: str,
@@ -31,34 +94,110 @@ def send_task(
     """
     if api == "anthropic":
         client = anthropic.Anthropic(api_key=api_key)
-        messages: list[MessageParam] = [
-            {
-                "role": "user",
-                "content": task
-            }
-        ]
-        response = client.messages.create(
-            model="claude-3-opus-20240229",
-            system=role,
-            temperature=0.0,
-            max_tokens=4096,
-            messages=messages
-        )
+        response = client.messages.create(**anthropic_request(task, role))
         return response.content[0].text
 
     elif api == "gemini":
         # Google Gemini
         client = genai.Client(api_key=api_key)
         response = client.models.generate_content(
-            model="gemini-2.0-flash",
+            model=GEMINI_MODEL,
             contents=task
         )
-        return re.sub(r'\W+', '', response.text)
+        return strip_non_word_characters(response.text)
 
     else:
         raise ValueError(f"Unsupported API: {api}")
 
 
+async def send_task_async(
+    task: str,
+    role: str,
+    api: Literal["anthropic", "gemini"],
+    api_key: str
+) -> str:
+    """
+    Send a task to a specified LLM API without blocking the event loop and return the model's raw response.
+
+    Args:
+        task (str): The prompt to send to the language model
+        role (str): The system prompt that defines the assistant's role or behavior
+        api (str): The name of the API to use ("anthropic" or "gemini")
+        api_key (str): The API key required to authenticate with the service
+
+    Returns:
+        str: The text content of the LLM's response
+
+    Raises:
+        ValueError: If the specified API name is unsupported
+    """
+    if api == "anthropic":
+        # Close the client's connection pool before the event loop (e.g. of `asyncio.run`) is closed
+        async with anthropic.AsyncAnthropic(api_key=api_key) as client:
+            response = await client.messages.create(**anthropic_request(task, role))
+        return response.content[0].text
+
+    elif api == "gemini":
+        # Google Gemini
+        with genai.Client(api_key=api_key) as client:
+            async with client.aio as aio_client:
+                response = await aio_client.models.generate_content(
+                    model=GEMINI_MODEL,
+                    contents=task
+                )
+        return strip_non_word_characters(response.text)
+
+    else:
+        raise ValueError(f"Unsupported API: {api}")
+
+
+def _per_frame_cache(
+    cache: Dict[tuple[int, Any], tuple[weakref.ref, T]],
+    frame: pd.DataFrame,
+    key: Hashable,
+    build: Callable[[], T]
+) -> T:
+    """
+    Return the value cached for a DataFrame and key, building it with `build` on the first call.
+
+    Entries are keyed by id(frame) and dropped as soon as the DataFrame is garbage collected,
+    so the DataFrame must not be modified in place between calls.
+
+    Args:
+        cache (Dict): The cache to look up and fill
+        frame (pd.DataFrame): The DataFrame the value is derived from
+        key (Hashable): An additional key, for values that depend on more than the DataFrame
+        build (Callable[[], T]): Builds the value on a cache miss
+
+    Returns:
+        T: The cached or newly built value.
+    """
+    cache_key = (id(frame), key)
+    cached = cache.get(cache_key)
+    if cached is not None and cached[0]() is frame:
+        return cached[1]
+
+    value = build()
+    cache[cache_key] = (
+        weakref.ref(frame, lambda _: cache.pop(cache_key, None)),
+        value
+    )
+    return value
+
+
+def candidate_ids(cand: pd.DataFrame) -> frozenset:
+    """
+    Return the set of Glottocodes in a candidates DataFrame, built only once per DataFrame.
+
+    Args:
+        cand (pd.DataFrame): A DataFrame of candidate languages, each with an 'id' column
+
+    Returns:
+        frozenset: The values of the 'id' column.
+    """
+    return _per_frame_cache(_CANDIDATE_IDS_CACHE, cand, None, lambda: frozenset(cand['id'].values))
+
+
 def sanity_check(glottocode_guess: str, cand: pd.DataFrame) -> bool:
     """
     Check whether a guessed Glottocode is valid.
@@ -71,41 +210,44 @@ def sanity_check(glottocode_guess: str, cand: pd.DataFrame) -> bool:
         bool: True if the guessed Glottocode is in the list of candidates or is an empty string (no match found);
               False otherwise.
     """
-    return glottocode_guess in cand['id'].values or glottocode_guess == ''
+    return glottocode_guess in candidate_ids(cand) or glottocode_guess == ''
 
 
-def guess_glottocode(
-        language: str,
-        candidates: pd.DataFrame,
-        api: Literal["anthropic", "gemini"],
-) -> str | None:
+def build_prompt(language: str, candidates: pd.DataFrame) -> tuple[str, str]:
     """
-    Use an LLM API to guess the Glottocode for a given language name.
+    Build the task and role prompts asking an LLM to pick the Glottocode of a language from a list of candidates.
 
-    The function builds a prompt based on a list of candidate languages and uses a language model
-    to identify the most likely Glottolog match. If no good match is found or the result is invalid,
-    it returns None.
+    Prompts are cached per candidates DataFrame and language, so repeated calls (e.g. one per API)
+    serialise the candidates only once.
 
     Args:
         language (str): The name of the language to identify (e.g., "Yuracaré")
         candidates (pd.DataFrame): A DataFrame with columns:
             - 'name': Language name
             - 'id': Glottocode
-        api (str): The name of the LLM API to use, either 'gemini' or 'anthropic'
 
     Returns:
-        str | None: The predicted glottocode as plain text if valid, else None.
+        tuple[str, str]: The task prompt and the system prompt (role).
     """
-
     lang = language.strip().capitalize()
+    return _per_frame_cache(_PROMPT_CACHE, candidates, lang, lambda: _build_prompt(lang, candidates))
+
 
+def _build_prompt(lang: str, candidates: pd.DataFrame) -> tuple[str, str]:
+    """Build the uncached task and role prompts for the normalised language name `lang`."""
     role = (
         "You are an experienced linguist at a prestigious university. "
         "You work very carefully and do not want to make mistakes, as they might harm your reputation."
     )
 
     # Convert candidate DataFrame to JSON for the prompt
-    cand = candidates.loc[:, ['name', 'id']].rename(columns={'id': 'glottocode'}).to_json(orient='records')
+    cand = json.dumps(
+        [
+            {"name": name, "glottocode": glottocode}
+            for name, glottocode in zip(candidates['name'].to_numpy(), candidates['id'].to_numpy())
+        ],
+        separators=(',', ':')
+    )
 
     task = (
         f"<candidates> is a JSON file containing information about languages and their glottocodes. "
@@ -119,12 +261,51 @@ def guess_glottocode(
         f"If no suitable match is found, return an empty result. "
         f"Return the Glottocode as plain text without additional text or comments."
     )
+    return task, role
+
+
+def check_api(api: str) -> None:
+    """
+    Check whether an LLM API is supported.
+
+    Args:
+        api (str): The name of the LLM API
+
+    Raises:
+        ValueError: If the API is neither 'gemini' nor 'anthropic'
+    """
     if api not in {'gemini', 'anthropic'}:
         raise ValueError(f"Invalid language model: {api}. "
                          f"Must be either 'gemini' or 'anthropic'")
-    else:
-        api_key = get_api_key(api)
-        response = send_task(task, role, api, api_key)
+
+
+def guess_glottocode(
+        language: str,
+        candidates: pd.DataFrame,
+        api: Literal["anthropic", "gemini"],
+) -> str | None:
+    """
+    Use an LLM API to guess the Glottocode for a given language name.
+
+    The function builds a prompt based on a list of candidate languages and uses a language model
+    to identify the most likely Glottolog match. If no good match is found or the result is invalid,
+    it returns None.
+
+    Args:
+        language (str): The name of the language to identify (e.g., "Yuracaré")
+        candidates (pd.DataFrame): A DataFrame with columns:
+            - 'name': Language name
+            - 'id': Glottocode
+        api (str): The name of the LLM API to use, either 'gemini' or 'anthropic'
+
+    Returns:
+        str | None: The predicted glottocode as plain text if valid, else None.
+    """
+    check_api(api)
+    task, role = build_prompt(language, candidates)
+
+    api_key = get_api_key(api)
+    response = send_task(task, role, api, api_key)
 
     if sanity_check(response, candidates):
         return response
@@ -132,16 +313,89 @@ def guess_glottocode(
         return None
 
 
+async def guess_glottocodes_async(
+        language: str,
+        candidates: pd.DataFrame,
+        apis: Sequence[Literal["anthropic", "gemini"]] = ("gemini", "anthropic"),
+) -> Dict[str, str | None]:
+    """
+    Use several LLM APIs concurrently to guess the Glottocode for a given language name.
+
+    The prompt is built once and sent to all APIs at the same time, so the total waiting time
+    is that of the slowest API rather than the sum over all APIs. A failing request is reported
+    and yields None for its API, without affecting the other APIs.
+
+    Args:
+        language (str): The name of the language to identify (e.g., "Yuracaré")
+        candidates (pd.DataFrame): A DataFrame with columns:
+            - 'name': Language name
+            - 'id': Glottocode
+        apis (Sequence[str]): The names of the LLM APIs to use, each either 'gemini' or 'anthropic'
+
+    Returns:
+        Dict[str, str | None]: The predicted glottocode per API if valid, else None.
+    """
+    for api in apis:
+        check_api(api)
+    task, role = build_prompt(language, candidates)
+
+    api_keys = [get_api_key(api) for api in apis]
+    responses = await asyncio.gather(
+        *[send_task_async(task, role, api, api_key) for api, api_key in zip(apis, api_keys)],
+        return_exceptions=True
+    )
+
+    guesses = {}
+    for api, response in zip(apis, responses):
+        if isinstance(response, Exception):
+            print(f"[{type(response).__name__}] {response}. Request to '{api}' failed.")
+            guesses[api] = None
+        elif isinstance(response, BaseException):
+            raise response
+        else:
+            guesses[api] = response if sanity_check(response, candidates) else None
+
+    return guesses
+
+
+def guess_glottocodes(
+        language: str,
+        candidates: pd.DataFrame,
+        apis: Sequence[Literal["anthropic", "gemini"]] = ("gemini", "anthropic"),
+) -> Dict[str, str | None]:
+    """
+    Use several LLM APIs concurrently to guess the Glottocode for a given language name.
+
+    Blocking wrapper around `guess_glottocodes_async`.
+
+    Args:
+        language (str): The name of the language to identify (e.g., "Yuracaré")
+        candidates (pd.DataFrame): A DataFrame with columns:
+            - 'name': Language name
+            - 'id': Glottocode
+        apis (Sequence[str]): The names of the LLM APIs to use, each either 'gemini' or 'anthropic'
+
+    Returns:
+        Dict[str, str | None]: The predicted glottocode per API if valid, else None.
+    """
+    return asyncio.run(guess_glottocodes_async(language, candidates, apis))
+
+
 def get_api_key(api: str) -> str:
     """
     Retrieve or prompt for the API key from the system keyring.
 
+    The key is kept in memory after the first call, so the keyring is queried only once per API.
+
     Args:
         api (str): The name of the API service. Supported values are "anthropic" and "gemini".
 
     Returns:
         str: The stored or newly provided API key for the given service.
     """
+    if api in _API_KEY_CACHE:
+        return _API_KEY_CACHE[api]
+
     service_name = f"{api}_guess_glottocode"
     key = keyring.get_password(service_name, "user")
 
@@ -155,4 +409,12 @@ def get_api_key(api: str) -> str:
 
         keyring.set_password(service_name, "user", key)
 
+    _API_KEY_CACHE[api] = key
     return key
+
+
+def clear_api_key_cache() -> None:
+    """
+    Forget the API keys kept in memory, so that `get_api_key` queries the keyring again.
+    """
+    _API_KEY_CACHE.clear()
@@ -1,23 +1,45 @@
+import asyncio
+import httpx
 import requests
-import io
+import shutil
+import tempfile
 import zipfile
 import pandas as pd
 import geopandas as gpd
+import numpy as np
+import pickle
+import shapely
 import configparser
+import time
 
 
+from collections import defaultdict
+from functools import lru_cache
+from importlib.util import find_spec
 from geopandas import GeoDataFrame
-from typing import List, Union, Dict, Any
+from typing import List, Union, Dict, Any, Iterable, NamedTuple
 from pathlib import Path
 from platformdirs import user_cache_dir
+from requests.adapters import HTTPAdapter
+from pyproj import Transformer
+from shapely import STRtree, box
 from shapely.geometry import Point, Polygon, MultiPolygon
 from urllib.parse import urljoin
-from io import StringIO
 
 
 APP_NAME = "guess_glottocode"
 LOOKUP_URL = "https://cdstar.eva.mpg.de//bitstreams/EAEA0-2198-D710-AA36-0/glottolog_languoid.csv.zip"
 LOOKUP_FILENAME_IN_ZIP = "languoid.csv"
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+PROCESSED_FILENAME = "glottolog.pkl"
+MD_INI_MAX_AGE = 30 * 24 * 60 * 60  # 30 days, in seconds
+
+# Shared HTTP session, so that repeated requests to the same host reuse open connections
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# Use the multithreaded pyarrow CSV parser if pyarrow is installed
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
 
 GeometryInput = Union[
     tuple[float, float],
@@ -27,6 +49,26 @@ GeometryInput = Union[
     gpd.GeoSeries
 ]
 
+
+class RelativesIndex(NamedTuple):
+    """Hash lookups over the 'id' and 'parent_id' columns of a Glottolog DataFrame."""
+    id_to_row: Dict[str, int]
+    parent_to_children: Dict[str, List[str]]
+    parent_of: Dict[str, Any]
+
+
+class GlottologIndex(NamedTuple):
+    """The Glottolog columns used by spatial queries, as plain NumPy arrays in row order."""
+    levels: np.ndarray
+    lon: np.ndarray
+    lat: np.ndarray
+    tree: STRtree
+
+
+# Normalised Glottolog names already retrieved, keyed by Glottocode (None if not found)
+_GLOTTOLOG_NAMES_CACHE: Dict[str, frozenset[str] | None] = {}
+
+
 def get_lookup_table(force_refresh: bool = False) -> Path:
     """
     Download and cache a lookup table embedded in a ZIP file from a remote URL.
@@ -52,18 +94,25 @@ def get_lookup_table(force_refresh: bool = False) -> Path:
     cache_file = cache_dir / "languoid.csv"
 
     if not cache_file.exists() or force_refresh:
-        response = requests.get(LOOKUP_URL)
-        response.raise_for_status()
-
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-            if LOOKUP_FILENAME_IN_ZIP not in zf.namelist():
-                raise FileNotFoundError(
-                    f"'{LOOKUP_FILENAME_IN_ZIP}' not found in the ZIP archive "
-                    f"downloaded from: '{LOOKUP_URL}'."
-                )
-
-            with zf.open(LOOKUP_FILENAME_IN_ZIP) as source, cache_file.open('wb') as target:
-                target.write(source.read())
+        # Stream the archive to a temporary file instead of holding it in memory
+        with HTTP_SESSION.get(LOOKUP_URL, stream=True) as response, tempfile.TemporaryFile() as archive:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                archive.write(chunk)
+            archive.seek(0)
+
+            with zipfile.ZipFile(archive) as zf:
+                if LOOKUP_FILENAME_IN_ZIP not in zf.namelist():
+                    raise FileNotFoundError(
+                        f"'{LOOKUP_FILENAME_IN_ZIP}' not found in the ZIP archive "
+                        f"downloaded from: '{LOOKUP_URL}'."
+                    )
+
+                with zf.open(LOOKUP_FILENAME_IN_ZIP) as source, cache_file.open('wb') as target:
+                    shutil.copyfileobj(source, target, length=DOWNLOAD_CHUNK_SIZE)
+
+        # The loaded Glottolog data is stale now
+        clear_glottolog_cache()
 
     return cache_file
 
@@ -73,18 +122,173 @@ def get_glottolog() -> gpd.GeoDataFrame:
 
     This function reads a cached CSV file containing language metadata and coordinates
     (longitude, latitude), and returns it as a GeoDataFrame with geographic point geometry.
+    The result is cached in memory (see `load_glottolog`), so the same GeoDataFrame is
+    returned on every call. It must not be modified in place.
 
     Returns:
         GeoDataFrame: A GeoDataFrame with language metadata and geographic point geometry.
                       The CRS is set to EPSG:4326 (WGS84).
     """
+    return load_glottolog()[0]
+
+
+def get_relatives_index() -> RelativesIndex:
+    """
+    Return the relatives index of the Glottolog data returned by `get_glottolog`.
+
+    Returns:
+        RelativesIndex: Hash lookups over the Glottolog hierarchy (see `index_relatives`).
+    """
+    return load_glottolog()[1]
+
+
+def get_glottolog_index() -> GlottologIndex:
+    """
+    Return the columns of the Glottolog data needed by `geo_filter_glottocodes` as NumPy arrays.
+
+    Returns:
+        GlottologIndex: The 'level', 'longitude' and 'latitude' columns and a spatial index
+                        of the points (see `index_glottolog`).
+    """
+    return load_glottolog()[2]
+
+
+@lru_cache(maxsize=1)
+def load_glottolog() -> tuple[gpd.GeoDataFrame, RelativesIndex, GlottologIndex]:
+    """
+    Load the Glottolog GeoDataFrame together with its relatives index and its column arrays.
+
+    The processed data is stored next to the CSV file and reused on later runs,
+    as long as the CSV file has not been replaced.
+
+    Returns:
+        tuple[GeoDataFrame, RelativesIndex, GlottologIndex]: The Glottolog GeoDataFrame,
+            its relatives index and its column arrays.
+    """
     lookup_path = get_lookup_table()
-    df = pd.read_csv(lookup_path)
+    processed_path = lookup_path.with_name(PROCESSED_FILENAME)
+
+    processed = load_processed_glottolog(lookup_path, processed_path)
+    if processed is not None:
+        return processed
+
+    glottolog = build_glottolog(lookup_path)
+    relatives = index_relatives(glottolog)
+    glottolog_index = index_glottolog(glottolog)
+    save_processed_glottolog(glottolog, relatives, glottolog_index, processed_path)
+    return glottolog, relatives, glottolog_index
+
+
+def build_glottolog(lookup_path: Path) -> gpd.GeoDataFrame:
+    """
+    Read the Glottolog CSV file and convert it into a GeoDataFrame with point geometries.
+
+    Args:
+        lookup_path (Path): The local path to the Glottolog lookup table CSV file
+
+    Returns:
+        GeoDataFrame: A GeoDataFrame with language metadata and geographic point geometry.
+                      The CRS is set to EPSG:4326 (WGS84).
+    """
+    df = pd.read_csv(lookup_path, engine=CSV_ENGINE)
+    if CSV_ENGINE == "pyarrow":
+        # pyarrow reads missing strings as None, the C parser as NaN. Use NaN with both engines,
+        # so that the Glottolog data does not depend on whether pyarrow is installed
+        df = df.where(df.notna(), np.nan)
+
+    # Build all points in one vectorised call. Entries without coordinates (e.g. most families)
+    # are kept for the hierarchy, but get a missing geometry instead of a POINT (NaN NaN)
+    lon = df['longitude'].to_numpy(np.float64, copy=False)
+    lat = df['latitude'].to_numpy(np.float64, copy=False)
+    has_coordinates = np.isfinite(lon) & np.isfinite(lat)
+
+    geometry = np.full(len(df), None, dtype=object)
+    geometry[has_coordinates] = shapely.points(lon[has_coordinates], lat[has_coordinates])
+
+    return GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
+
+
+def load_processed_glottolog(
+    lookup_path: Path,
+    processed_path: Path
+) -> tuple[gpd.GeoDataFrame, RelativesIndex, GlottologIndex] | None:
+    """
+    Load the processed Glottolog data stored by `save_processed_glottolog`.
+
+    Args:
+        lookup_path (Path): The local path to the Glottolog lookup table CSV file
+        processed_path (Path): The local path to the processed Glottolog data
+
+    Returns:
+        tuple[GeoDataFrame, RelativesIndex, GlottologIndex] | None: The Glottolog GeoDataFrame,
+            its relatives index and its column arrays, or None if the processed data is missing,
+            older than the CSV file or cannot be read.
+    """
+    if not processed_path.exists() or processed_path.stat().st_mtime < lookup_path.stat().st_mtime:
+        return None
+
+    try:
+        with processed_path.open('rb') as f:
+            processed = pickle.load(f)
+        return processed['glottolog'], processed['relatives'], processed['glottolog_index']
+    except Exception as e:
+        # E.g. written by incompatible versions of pandas or geopandas, or by an older version of this package
+        print(f"Could not load {processed_path}: {e}. Rebuilding the Glottolog data.")
+        return None
+
+
+def save_processed_glottolog(
+    glottolog: gpd.GeoDataFrame,
+    relatives: RelativesIndex,
+    glottolog_index: GlottologIndex,
+    processed_path: Path
+) -> None:
+    """
+    Store the processed Glottolog data, so that later runs can skip parsing the CSV file.
+
+    Args:
+        glottolog (GeoDataFrame): The Glottolog GeoDataFrame returned by `build_glottolog`
+        relatives (RelativesIndex): The relatives index of `glottolog`
+        glottolog_index (GlottologIndex): The column arrays of `glottolog`
+        processed_path (Path): The local path to store the processed Glottolog data
+    """
+    # Write to a temporary file first, so that readers never see a partially written file
+    tmp_path = processed_path.with_name(processed_path.name + ".tmp")
+    with tmp_path.open('wb') as f:
+        processed = {'glottolog': glottolog, 'relatives': relatives, 'glottolog_index': glottolog_index}
+        pickle.dump(processed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(processed_path)
+
+
+def clear_glottolog_cache() -> None:
+    """
+    Discard the in-memory Glottolog data, so that the next call to `get_glottolog` reloads it from disk.
+
+    The Glottolog names retrieved for verification are discarded as well, as they depend on the hierarchy.
+    """
+    load_glottolog.cache_clear()
+    _GLOTTOLOG_NAMES_CACHE.clear()
 
-    return GeoDataFrame(
-        df,
-        geometry=gpd.points_from_xy(df.longitude, df.latitude),
-        crs="EPSG:4326"
+
+def index_glottolog(glottolog: gpd.GeoDataFrame) -> GlottologIndex:
+    """
+    Extract the columns needed by `geo_filter_glottocodes` as NumPy arrays.
+
+    Working on these arrays avoids carrying all other Glottolog columns through every
+    intermediate selection.
+
+    Args:
+        glottolog (GeoDataFrame): The Glottolog GeoDataFrame returned by `build_glottolog`
+
+    Returns:
+        GlottologIndex: The 'level', 'longitude' and 'latitude' columns, and an STRtree
+                        over the point geometries that returns row positions.
+    """
+    return GlottologIndex(
+        levels=glottolog['level'].to_numpy(),
+        lon=glottolog['longitude'].to_numpy(np.float64),
+        lat=glottolog['latitude'].to_numpy(np.float64),
+        tree=STRtree(glottolog.geometry.values)
     )
 
 
@@ -114,75 +318,111 @@ def geo_filter_glottocodes(
         GeoDataFrame: A GeoDataFrame of Glottolog entries that match spatially
                       filtered by the specified level (if not 'all').
     """
+    if level not in {'all', 'language', 'dialect', 'family'}:
+        raise ValueError(f"Invalid level: {level}. "
+                         f"Must be one of 'all', 'language', 'dialect', 'family'.")
+
     language_geometry = process_location(language_location)
     glottolog_geometries = get_glottolog()
+    glottolog_index = get_glottolog_index()
 
     estimated_utm = language_geometry.estimate_utm_crs()
+    language_utm = language_geometry.to_crs(estimated_utm)
 
     # Buffer in kilometers (convert to meters)
-    buffer_polygon = (
-        language_geometry.to_crs(estimated_utm)
-        .buffer(distance=buffer * 1000)
-        .to_crs(glottolog_geometries.crs)
+    distance = buffer * 1000
+
+    # Shortlist rows in the bounding box of the buffered location using the spatial index
+    minx, miny, maxx, maxy = language_utm.total_bounds
+    bbox = Transformer.from_crs(estimated_utm, glottolog_geometries.crs, always_xy=True).transform_bounds(
+        minx - distance, miny - distance, maxx + distance, maxy + distance, densify_pts=21
     )
+    if np.all(np.isfinite(bbox)) and bbox[0] <= bbox[2]:
+        rows = np.sort(glottolog_index.tree.query(box(*bbox)))
+    else:
+        # The bounding box crosses the antimeridian or leaves the projection's domain
+        rows = np.arange(len(glottolog_index.levels))
 
-    # Find nearby languages within buffer
-    near = gpd.sjoin(
-        glottolog_geometries,
-        gpd.GeoDataFrame(geometry=buffer_polygon, crs=glottolog_geometries.crs),
-        predicate='within'
-    )['id'].tolist()
+    # Find nearby languages within buffer, measured in the projected CRS
+    x, y = Transformer.from_crs(glottolog_geometries.crs, estimated_utm, always_xy=True).transform(
+        glottolog_index.lon[rows], glottolog_index.lat[rows]
+    )
+    projected = np.isfinite(x) & np.isfinite(y)
+    rows = rows[projected]
+    points = shapely.points(x[projected], y[projected])
+    hits = STRtree(language_utm.values).query(points, predicate='dwithin', distance=distance)[0]
+    near = glottolog_geometries['id'].to_numpy()[rows[np.unique(hits)]].tolist()
 
     # Include children and parents of nearby languages
-    children = find_children(near, glottolog_geometries)
-    parents = find_parents(near, glottolog_geometries)
+    relatives_index = get_relatives_index()
+    children = find_children(near, relatives_index)
+    parents = find_parents(near, relatives_index)
 
-    # Combine all candidate IDs and filter
+    # Combine all candidate IDs, filter by level and only then select the full rows
     candidate_ids = { *near, *children, *parents }
-    candidates = glottolog_geometries.loc[
-        glottolog_geometries['id'].isin(candidate_ids)
-    ]
+    id_to_row = relatives_index.id_to_row
+    candidate_rows = np.array(sorted(id_to_row[i] for i in candidate_ids if i in id_to_row), dtype=np.intp)
 
-    if level not in {'all', 'language', 'dialect', 'family'}:
-        raise ValueError(f"Invalid level: {level}. "
-                         f"Must be one of 'all', 'language', 'dialect', 'family'.")
+    if level != 'all':
+        candidate_rows = candidate_rows[glottolog_index.levels[candidate_rows] == level]
 
-    if level == 'all':
-        return candidates
-    else:
-        return candidates[candidates['level'] == level]
+    return glottolog_geometries.iloc[candidate_rows]
 
-def find_children(candidate_ids: List[Union[str, int]], relatives: pd.DataFrame) -> List[Union[str, int]]:
+
+def index_relatives(relatives: pd.DataFrame) -> RelativesIndex:
     """
-    Find the child IDs of given candidate languages IDs based on a DataFrame of relationships.
+    Build hash lookups for the family relationships in a DataFrame.
 
     Args:
-        candidate_ids (List[Union[str, int]]): A list of candidate IDs
         relatives (pd.DataFrame): A DataFrame with at least two columns:
             - 'id': Unique identifier for each row (child)
             - 'parent_id': Identifier of the parent
 
+    Returns:
+        RelativesIndex: A mapping from each 'id' to its row position and to its 'parent_id',
+                        and from each 'parent_id' to the IDs of its children.
+    """
+    ids = relatives['id'].to_numpy()
+    parent_ids = relatives['parent_id'].to_numpy()
+
+    id_to_row = {v: i for i, v in enumerate(ids)}
+    parent_to_children = defaultdict(list)
+    for child, parent in zip(ids, parent_ids):
+        parent_to_children[parent].append(child)
+    parent_of = dict(zip(ids, parent_ids))
+
+    return RelativesIndex(id_to_row, dict(parent_to_children), parent_of)
+
+
+def find_children(candidate_ids: List[Union[str, int]], relatives: RelativesIndex) -> List[Union[str, int]]:
+    """
+    Find the child IDs of given candidate languages IDs based on an index of relationships.
+
+    Args:
+        candidate_ids (List[Union[str, int]]): A list of candidate IDs
+        relatives (RelativesIndex): The relationships between IDs (see `index_relatives`)
+
     Returns:
         List[Union[str, int]]: A list of child IDs whose 'parent_id' matches any of the candidate IDs.
     """
-    return relatives[relatives['parent_id'].isin(candidate_ids)]['id'].tolist()
+    parent_to_children = relatives.parent_to_children
+    return [c for p in dict.fromkeys(candidate_ids) for c in parent_to_children.get(p, ())]
 
 
-def find_parents(candidate_ids: List[Union[str, int]], relatives: pd.DataFrame) -> List[str]:
+def find_parents(candidate_ids: List[Union[str, int]], relatives: RelativesIndex) -> List[str]:
     """
-    Find the parent IDs of given candidate IDs based on a DataFrame of relationships.
+    Find the parent IDs of given candidate IDs based on an index of relationships.
 
     Args:
         candidate_ids (List[Union[str, int]]): A list of candidate IDs
-        relatives (pd.DataFrame): A DataFrame with at least two columns:
-            - 'id': Unique identifier for each row (child)
-            - 'parent_id': Identifier of the parent
+        relatives (RelativesIndex): The relationships between IDs (see `index_relatives`)
 
     Returns:
         List[str]: A list of parent IDs (as strings) whose 'id' matches any of the candidate child IDs.
                    Only parent IDs of type `str` are included.
     """
-    parents = relatives[relatives['id'].isin(candidate_ids)]['parent_id']
+    parent_of = relatives.parent_of
+    parents = (parent_of.get(c) for c in dict.fromkeys(candidate_ids))
     return [p for p in parents if isinstance(p, str)]
 
 
@@ -219,27 +459,25 @@ def process_location(location: GeometryInput) -> gpd.GeoSeries:
             "Expected (lon, lat) tuple, Point, Polygon, or GeoSeries."
         )
 
-def find_ancestors(glottocode: str, relatives: pd.DataFrame) -> List[str]:
+def find_ancestors(glottocode: str, relatives: RelativesIndex) -> List[str]:
     """
     Trace the ancestry of a given language based on Glottocode hierarchy.
 
     Args:
         glottocode (str): The Glottocode of the language whose ancestors should be found
-        relatives (pd.DataFrame): A DataFrame containing 'id' and 'parent_id' columns representing the hierarchy.
+        relatives (RelativesIndex): The Glottocode hierarchy (see `index_relatives`)
 
     Returns:
         List[str]: A list of Glottocodes representing the ancestry path,
                    ordered from the root ancestor down to the input language.
     """
+    parent_of = relatives.parent_of
     ancestors = []
     current_glottocode = glottocode
 
     while isinstance(current_glottocode, str):
         ancestors.append(current_glottocode)
-        match = relatives[relatives['id'] == current_glottocode]
-        if match.empty:
-            break
-        current_glottocode = match['parent_id'].iloc[0]
+        current_glottocode = parent_of.get(current_glottocode)
 
     ancestors.reverse()
     return ancestors
@@ -270,9 +508,8 @@ def parse_ini(resp: str) -> Dict[str, Dict[str, str]]:
         and the value is a dictionary of key-value pairs from that section.
     """
 
-    ini_file = StringIO(resp)
-    config = configparser.ConfigParser(interpolation=None)
-    config.read_file(ini_file)
+    config = configparser.RawConfigParser()
+    config.read_string(resp)
 
     ini_dict = {
         section: dict(config.items(section))
@@ -298,33 +535,244 @@ def extract_altnames(response: Dict[str, Any]) -> Dict[str, List[str]]:
     """
     altnames = response.get('altnames', {})
     return {
-        key: [v for v in value.split('\n') if v]
+        key: [v for v in value.splitlines() if v]
         for key, value in altnames.items()
     }
 
-def check_name(language: str, name_glottolog: str, alt_names_glottolog: Dict[str, List[str]]) -> bool:
+def normalise_name(name: str) -> str:
     """
-    Check if a given language name matches either the primary name or any alternative names from Glottolog.
+    Normalise a language name for comparison (lower case, no leading whitespace).
+
+    Args:
+        name (str): A language name
+
+    Returns:
+        str: The normalised name.
+    """
+    return name.lower().lstrip()
+
+
+def normalise_names(name_glottolog: str, alt_names_glottolog: Dict[str, List[str]]) -> frozenset[str]:
+    """
+    Collect the normalised primary and alternative names of a Glottolog entry in a set.
 
     Args:
-        language (str): The language name to check
         name_glottolog (str): The primary Glottolog name
         alt_names_glottolog (Dict[str, List[str]]): A dictionary of alternative names, grouped by source
 
+    Returns:
+        frozenset[str]: The normalised primary name and all normalised alternative names.
+    """
+    return frozenset({
+        normalise_name(name_glottolog),
+        *(normalise_name(alt) for source in alt_names_glottolog.values() for alt in source)
+    })
+
+
+def check_name(language: str, names_glottolog: frozenset[str]) -> bool:
+    """
+    Check if a given language name matches either the primary name or any alternative names from Glottolog.
+
+    Args:
+        language (str): The language name to check
+        names_glottolog (frozenset[str]): The normalised primary and alternative Glottolog names
+            (see `normalise_names`)
+
     Returns:
         bool: True if the language matches the primary or any alternative name; False otherwise.
     """
-    norm = lambda s: s.lower().lstrip()
+    return normalise_name(language) in names_glottolog
 
-    if norm(name_glottolog) == norm(language):
-        return True
 
-    for source in alt_names_glottolog.values():
-        for alt in source:
-            if norm(alt) == norm(language):
-                return True
+def md_ini_cache_file(glottocode: str) -> Path | None:
+    """
+    Return the path where the `md.ini` file of a Glottocode is cached on disk.
+
+    Args:
+        glottocode (str): The Glottocode whose metadata should be cached
 
-    return False
+    Returns:
+        Path | None: The path of the cache file, or None if `glottocode` is not a plain
+                     alphanumeric Glottocode (anything else must not end up in a file path).
+    """
+    if not glottocode.isalnum():
+        return None
+
+    cache_dir = Path(user_cache_dir(APP_NAME)) / "md_ini"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{glottocode}.ini"
+
+
+def read_cached_md_ini(cache_file: Path | None) -> str | None:
+    """
+    Read a cached `md.ini` file if it is younger than `MD_INI_MAX_AGE` seconds.
+
+    Args:
+        cache_file (Path | None): The path returned by `md_ini_cache_file`
+
+    Returns:
+        str | None: The content of the cached file, or None if there is no recent copy.
+    """
+    if cache_file is not None and cache_file.exists() \
+            and time.time() - cache_file.stat().st_mtime < MD_INI_MAX_AGE:
+        return cache_file.read_text(encoding="utf-8")
+    return None
+
+
+def md_ini_url(glottocode: str, relatives: RelativesIndex) -> str:
+    """
+    Construct the URL of the `md.ini` file of a Glottocode in the Glottolog GitHub repository.
+
+    Args:
+        glottocode (str): The Glottocode whose metadata should be retrieved
+        relatives (RelativesIndex): The Glottocode hierarchy (see `index_relatives`)
+
+    Returns:
+        str: The URL of the `md.ini` file.
+    """
+    url_header = "https://raw.githubusercontent.com/glottolog/glottolog/master/languoids/tree"
+    ancestors = find_ancestors(glottocode, relatives)
+    return build_url(ancestors, url_header)
+
+
+def get_md_ini(glottocode: str, relatives: RelativesIndex) -> str | None:
+    """
+    Retrieve the `md.ini` metadata file of a Glottocode from the Glottolog GitHub repository.
+
+    Files are cached on disk in the OS-specific cache directory and fetched again
+    once they are older than `MD_INI_MAX_AGE` seconds.
+
+    Args:
+        glottocode (str): The Glottocode whose metadata should be retrieved
+        relatives (RelativesIndex): The Glottocode hierarchy (see `index_relatives`)
+
+    Returns:
+        str | None: The content of the `md.ini` file, or None if it could not be found.
+
+    Raises:
+        requests.RequestException: If the request fails or returns an error status other than 404.
+    """
+    cache_file = md_ini_cache_file(glottocode)
+    md_ini = read_cached_md_ini(cache_file)
+    if md_ini is not None:
+        return md_ini
+
+    url = md_ini_url(glottocode, relatives)
+
+    response_ini = HTTP_SESSION.get(url)
+    if response_ini.status_code == 404:
+        print(f"Could not open {url}. Glottocode verification failed.")
+        return None
+    response_ini.raise_for_status()
+
+    if cache_file is not None:
+        cache_file.write_text(response_ini.text, encoding="utf-8")
+
+    return response_ini.text
+
+
+async def get_md_ini_async(
+    glottocode: str,
+    relatives: RelativesIndex,
+    client: httpx.AsyncClient
+) -> str | None:
+    """
+    Retrieve the `md.ini` metadata file of a Glottocode without blocking the event loop.
+
+    Uses the same disk cache as `get_md_ini`.
+
+    Args:
+        glottocode (str): The Glottocode whose metadata should be retrieved
+        relatives (RelativesIndex): The Glottocode hierarchy (see `index_relatives`)
+        client (httpx.AsyncClient): The HTTP client used for the request
+
+    Returns:
+        str | None: The content of the `md.ini` file, or None if it could not be found.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status other than 404.
+    """
+    cache_file = md_ini_cache_file(glottocode)
+    md_ini = read_cached_md_ini(cache_file)
+    if md_ini is not None:
+        return md_ini
+
+    url = md_ini_url(glottocode, relatives)
+
+    response_ini = await client.get(url)
+    if response_ini.status_code == 404:
+        print(f"Could not open {url}. Glottocode verification failed.")
+        return None
+    response_ini.raise_for_status()
+
+    if cache_file is not None:
+        cache_file.write_text(response_ini.text, encoding="utf-8")
+
+    return response_ini.text
+
+
+def names_from_md_ini(md_ini: str) -> frozenset[str]:
+    """
+    Extract the normalised primary and alternative names from the content of an `md.ini` file.
+
+    Args:
+        md_ini (str): The content of an `md.ini` file
+
+    Returns:
+        frozenset[str]: The normalised names (see `normalise_names`).
+    """
+    response_dict = parse_ini(md_ini)
+    name_glottolog = response_dict['core']['name']
+    altnames_glottolog = extract_altnames(response_dict)
+
+    return normalise_names(name_glottolog, altnames_glottolog)
+
+
+def get_glottolog_names(glottocode: str) -> frozenset[str] | None:
+    """
+    Retrieve the normalised primary and alternative names of a Glottocode from Glottolog.
+
+    Results are cached in memory, and the Glottolog metadata is cached on disk (see `get_md_ini`).
+
+    Args:
+        glottocode (str): The Glottocode whose names should be retrieved
+
+    Returns:
+        frozenset[str] | None: The normalised names (see `normalise_names`),
+                               or None if the metadata could not be found.
+
+    Raises:
+        requests.RequestException: If the request fails or returns an error status other than 404.
+    """
+    if glottocode not in _GLOTTOLOG_NAMES_CACHE:
+        md_ini = get_md_ini(glottocode, get_relatives_index())
+        _GLOTTOLOG_NAMES_CACHE[glottocode] = None if md_ini is None else names_from_md_ini(md_ini)
+
+    return _GLOTTOLOG_NAMES_CACHE[glottocode]
+
+
+async def get_glottolog_names_async(glottocode: str, client: httpx.AsyncClient) -> frozenset[str] | None:
+    """
+    Retrieve the normalised names of a Glottocode without blocking the event loop.
+
+    Shares its in-memory cache with `get_glottolog_names`.
+
+    Args:
+        glottocode (str): The Glottocode whose names should be retrieved
+        client (httpx.AsyncClient): The HTTP client used for the request
+
+    Returns:
+        frozenset[str] | None: The normalised names (see `normalise_names`),
+                               or None if the metadata could not be found.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status other than 404.
+    """
+    if glottocode not in _GLOTTOLOG_NAMES_CACHE:
+        md_ini = await get_md_ini_async(glottocode, get_relatives_index(), client)
+        _GLOTTOLOG_NAMES_CACHE[glottocode] = None if md_ini is None else names_from_md_ini(md_ini)
+
+    return _GLOTTOLOG_NAMES_CACHE[glottocode]
 
 
 def verify_glottocode_guess(language: str, glottocode: str | None) -> bool:
@@ -332,6 +780,8 @@ def verify_glottocode_guess(language: str, glottocode: str | None) -> bool:
     Verify whether a guessed Glottocode corresponds to a given language name
     using metadata scraped from Glottolog.
 
+    The Glottolog names are cached per Glottocode (see `get_glottolog_names`).
+
     Args:
         language (str): The name of the language to verify (e.g., "Yuracaré")
         glottocode (str): The guessed Glottocode to verify
@@ -343,24 +793,107 @@ def verify_glottocode_guess(language: str, glottocode: str | None) -> bool:
     if glottocode is None:
         return False
 
-    glottolog_data = get_glottolog()
-    url_header = "https://raw.githubusercontent.com/glottolog/glottolog/master/languoids/tree"
+    try:
+        names_glottolog = get_glottolog_names(glottocode)
+        if names_glottolog is None:
+            return False
+
+        return check_name(language, names_glottolog)
+
+    except (requests.RequestException, configparser.Error, KeyError) as e:
+        print(f"[{type(e).__name__}] {e}. Glottocode verification failed.")
+        return False
 
+
+async def try_get_glottolog_names_async(glottocode: str, client: httpx.AsyncClient) -> frozenset[str] | None:
+    """
+    Retrieve the normalised names of a Glottocode like `get_glottolog_names_async`, but report failures
+    instead of raising them, so that one failing Glottocode does not affect others fetched concurrently.
+
+    Args:
+        glottocode (str): The Glottocode whose names should be retrieved
+        client (httpx.AsyncClient): The HTTP client used for the request
+
+    Returns:
+        frozenset[str] | None: The normalised names (see `normalise_names`),
+                               or None if the metadata could not be found or retrieved.
+    """
     try:
-        ancestors = find_ancestors(glottocode, glottolog_data)
-        url = build_url(ancestors, url_header)
+        return await get_glottolog_names_async(glottocode, client)
 
-        response_ini = requests.get(url)
-        if response_ini.status_code == 404:
-            print(f"Could not open {url}. Glottocode verification failed.")
-            return False
+    except (httpx.HTTPError, configparser.Error, KeyError) as e:
+        print(f"[{type(e).__name__}] {e}. Glottocode verification failed.")
+        return None
 
-        response_dict = parse_ini(response_ini.text)
-        name_glottolog = response_dict['core']['name']
-        altnames_glottolog = extract_altnames(response_dict)
 
-        return check_name(language, name_glottolog, altnames_glottolog)
+async def verify_glottocode_guess_async(
+    language: str,
+    glottocode: str | None,
+    client: httpx.AsyncClient
+) -> bool:
+    """
+    Verify whether a guessed Glottocode corresponds to a given language name without blocking the event loop.
+
+    Same as `verify_glottocode_guess`, but fetches the Glottolog metadata with an asynchronous
+    HTTP client, so that many verifications can run concurrently (see `verify_many`).
+
+    Args:
+        language (str): The name of the language to verify (e.g., "Yuracaré")
+        glottocode (str): The guessed Glottocode to verify
+        client (httpx.AsyncClient): The HTTP client used for the request
 
-    except IndexError as e:
-        print(f"[IndexError] {e}. Glottocode verification failed.")
+    Returns:
+        bool: True if the name or one of its alternate names matches the input language.
+              False if the Glottocode is invalid or verification fails.
+    """
+    if glottocode is None:
         return False
+
+    names_glottolog = await try_get_glottolog_names_async(glottocode, client)
+    return names_glottolog is not None and check_name(language, names_glottolog)
+
+
+async def verify_many_async(pairs: Iterable[tuple[str, str | None]]) -> List[bool]:
+    """
+    Verify many (language, Glottocode) pairs concurrently.
+
+    Each distinct Glottocode is fetched only once, and all requests share one connection pool
+    (multiplexed over HTTP/2 if the `h2` package is installed). A Glottocode that cannot be
+    retrieved only fails the pairs it appears in.
+
+    Args:
+        pairs (Iterable[tuple[str, str | None]]): (language, glottocode) pairs to verify
+
+    Returns:
+        List[bool]: The verification result of each pair, in the order of `pairs`.
+    """
+    pairs = list(pairs)
+    glottocodes = list(dict.fromkeys(glottocode for _, glottocode in pairs if glottocode is not None))
+
+    async with httpx.AsyncClient(
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=20)
+    ) as client:
+        names = dict(zip(glottocodes, await asyncio.gather(
+            *(try_get_glottolog_names_async(glottocode, client) for glottocode in glottocodes)
+        )))
+
+    return [
+        glottocode is not None and names[glottocode] is not None and check_name(language, names[glottocode])
+        for language, glottocode in pairs
+    ]
+
+
+def verify_many(pairs: Iterable[tuple[str, str | None]]) -> List[bool]:
+    """
+    Verify many (language, Glottocode) pairs concurrently.
+
+    Blocking wrapper around `verify_many_async`.
+
+    Args:
+        pairs (Iterable[tuple[str, str | None]]): (language, glottocode) pairs to verify
+
+    Returns:
+        List[bool]: The verification result of each pair, in the order of `pairs`.
+    """
+    return asyncio.run(verify_many_async(pairs))
@@ -1,13 +1,37 @@
 import wptools
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator
 from mediawiki import MediaWiki
 
-def query_wiki(language: str) -> List[Dict[str, str]]:
+# Maximum number of Wikipedia pages fetched at the same time
+MAX_WORKERS = 8
+
+# Number of Wikipedia search results considered per language
+MAX_RESULTS = 3
+
+
+@lru_cache(maxsize=1)
+def get_mediawiki() -> MediaWiki:
+    """
+    Return a shared MediaWiki client.
+
+    Creating a client queries the Wikipedia API, and each client holds its own HTTP session.
+    Reusing one client avoids that request and keeps the connection to Wikipedia open between queries.
+
+    Returns:
+        MediaWiki: A MediaWiki client for the English Wikipedia.
+    """
+    return MediaWiki()
+
+
+def query_wiki(language: str, results: int = MAX_RESULTS) -> List[Dict[str, str]]:
     """
     Query Wikipedia for pages related to a natural language.
 
     Args:
         language (str): The name of a natural language (e.g., "French", "Yuracaré").
+        results (int): Maximum number of search results to request from Wikipedia.
 
     Returns:
         List[Dict[str, str]]: A list of dictionaries, each containing:
@@ -17,7 +41,7 @@ def query_wiki(language: str) -> List[Dict[str, str]]:
         Results are sorted by their original relevance from Wikipedia.
     """
     pages = []
-    query_results = MediaWiki().search(f"{language} language")
+    query_results = get_mediawiki().search(f"{language} language", results=results)
 
     for i, q in enumerate(query_results):
         title_lower = q.lower()
@@ -37,12 +61,34 @@ def query_wiki(language: str) -> List[Dict[str, str]]:
     return sorted(pages, key=lambda d: d["relevance"])
 
 
+def fetch_infobox(site: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Retrieve the info box of a single Wikipedia page using wptools.
+
+    Args:
+        site (Dict[str, Any]): A page metadata dictionary with a 'title' key.
+
+    Returns:
+        Dict[str, Any]: The same dictionary, augmented with an 'infobox' key
+                        (a dictionary of infobox data, empty if the page fails to parse).
+    """
+    try:
+        # silent=True stops wptools from writing progress to stderr for every request
+        page = wptools.page(site["title"], silent=True).get_parse(show=False)
+        site["infobox"] = page.data.get("infobox", {})
+    except Exception as e:
+        site["infobox"] = {}
+        print(f"No infobox for '{site['title']}': {e}")
+    return site
+
+
 def retrieve_infobox(sites: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Retrieve info boxes from a list of Wikipedia pages using wptools.
 
     Each input dictionary must contain a 'title' key, which is used to query the page.
     Pages without info boxes or that fail to parse are excluded from the final result.
+    The pages are fetched concurrently.
 
     Args:
         sites (List[Dict[str, Any]]): A list of page metadata dictionaries, each with a 'title' key.
@@ -51,13 +97,11 @@ def retrieve_infobox(sites: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A filtered list of dictionaries, each augmented with an 'infobox' key
                               (a dictionary of infobox data).
     """
-    for s in sites:
-        try:
-            page = wptools.page(s["title"]).get_parse(show=False)
-            s["infobox"] = page.data.get("infobox", {})
-        except Exception as e:
-            s["infobox"] = {}
-            print(f"No infobox for '{s['title']}': {e}")
+    if not sites:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(sites))) as executor:
+        sites = list(executor.map(fetch_infobox, sites))
     return [s for s in sites if s["infobox"]]
 
 
@@ -113,7 +157,7 @@ def parse_glottocode(sites: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 def get_most_relevant_glottocode(
-    sites: List[Dict[str, Any]],
+    sites: Iterable[Dict[str, Any]],
     only_primary: bool = True
 ) -> str | None:
     """
@@ -121,7 +165,7 @@ def get_most_relevant_glottocode(
     this function returns None.
 
     Args:
-        sites (List[Dict[str, Any]]): A list of Wikipedia page dictionaries, each
+        sites (Iterable[Dict[str, Any]]): Wikipedia page dictionaries, ordered by relevance, each
             expected to contain a 'glottocode' key with a list of dicts, where each
             dict has a 'code' (str) and 'primary' (bool).
         only_primary (bool): If True, include only glottocodes marked as primary.
@@ -135,6 +179,34 @@ def get_most_relevant_glottocode(
                 return code_info["code"]
     return None
 
+def iter_sites_with_glottocode(sites: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily retrieve and parse the info boxes of Wikipedia pages, most relevant page first.
+
+    The most relevant page is fetched on its own. The remaining pages are only fetched,
+    concurrently with `retrieve_infobox`, once the pages from the first one have been consumed,
+    so callers that stop at a Glottocode from the first page skip all other requests.
+
+    Args:
+        sites (List[Dict[str, Any]]): Page metadata dictionaries, ordered by relevance, each with a 'title' key.
+
+    Yields:
+        Dict[str, Any]: Pages whose infobox contains Glottocodes, augmented with the
+                        'infobox', 'glotto_site' and 'glottocode' keys.
+    """
+    if not sites:
+        return
+
+    first, rest = sites[0], sites[1:]
+
+    fetch_infobox(first)
+    if first["infobox"]:
+        yield from parse_glottocode(parse_infobox([first]))
+
+    if rest:
+        yield from parse_glottocode(parse_infobox(retrieve_infobox(rest)))
+
+
 def guess_glottocode(
     language: str,
     only_primary: bool = True
@@ -149,32 +221,23 @@ def guess_glottocode(
     4. Extract glottocodes from those info boxes.
     5. Return glottocodes from the most relevant page.
 
+    Steps 2 to 5 run on the most relevant page first; the other pages are only
+    retrieved if it yields no Glottocode.
+
     Args:
         language (str): Name of the language to query.
         only_primary (bool): Whether to include only primary glottocodes.
 
     Returns:
-        str: List of guessed glottocodes, possibly empty if none found.
+        str | None: The guessed glottocode, or None if none was found.
     """
     language = language.strip().capitalize()
 
     wiki_sites = query_wiki(language)
     if not wiki_sites:
-        return []
-
-    sites_with_infobox = retrieve_infobox(wiki_sites)
-    if not sites_with_infobox:
-        return []
-
-    sites_with_glottocode_info = parse_infobox(sites_with_infobox)
-    if not sites_with_glottocode_info:
-        return []
-
-    sites_with_glottocode = parse_glottocode(sites_with_glottocode_info)
-    if not sites_with_glottocode:
-        return []
+        return None
 
     return get_most_relevant_glottocode(
-        sites_with_glottocode,
+        iter_sites_with_glottocode(wiki_sites),
         only_primary=only_primary
     )
@@ -0,0 +1,27 @@
+import pytest
+
+import guess_glottocode.utils as utils
+
+LANGUOIDS = """id,family_id,parent_id,name,bookkeeping,level,latitude,longitude,iso639P3code
+indo1319,,,Indo-European,False,family,,,
+roma1334,indo1319,indo1319,Romance,False,family,,,
+stan1290,indo1319,roma1334,French,False,language,48.0,2.0,fra
+pica1241,indo1319,roma1334,Picard,False,language,50.0,2.5,pcd
+norm1245,indo1319,pica1241,Norman,False,dialect,49.0,-0.5,
+stan1295,indo1319,indo1319,German,False,language,51.0,10.0,deu
+mand1415,,,Mandarin Chinese,False,language,35.0,110.0,cmn
+aust1307,,,Austronesian,False,family,,,
+fiji1243,aust1307,aust1307,Fijian,False,language,0.0,179.8,fij
+samo1305,aust1307,aust1307,Samoan,False,language,0.0,-179.8,smo
+kiri1244,aust1307,aust1307,Kiribati,False,language,0.0,170.0,gil
+"""
+
+
+@pytest.fixture
+def glottolog(tmp_path, monkeypatch):
+    """Serve a tiny languoid.csv instead of downloading the Glottolog lookup table."""
+    (tmp_path / "languoid.csv").write_text(LANGUOIDS)
+    monkeypatch.setattr(utils, "user_cache_dir", lambda app_name: str(tmp_path))
+    utils.clear_glottolog_cache()
+    yield
+    utils.clear_glottolog_cache()
@@ -0,0 +1,34 @@
+import pytest
+
+from shapely.geometry import Polygon
+
+from guess_glottocode.utils import geo_filter_glottocodes
+
+pytestmark = pytest.mark.usefixtures("glottolog")
+
+
+def test_point_includes_relatives():
+    candidates = geo_filter_glottocodes((2.5, 48.4), buffer=500, level="all")
+    # French, Picard and Norman are near; Romance is the parent of French and Picard
+    assert set(candidates["id"]) == {"stan1290", "pica1241", "norm1245", "roma1334"}
+
+
+def test_polygon():
+    france = Polygon([(1.0, 47.0), (3.0, 47.0), (3.0, 49.0), (1.0, 49.0)])
+    candidates = geo_filter_glottocodes(france, buffer=50, level="all")
+    assert set(candidates["id"]) == {"stan1290", "roma1334"}
+
+
+def test_antimeridian():
+    candidates = geo_filter_glottocodes((179.5, 0.0), buffer=100, level="language")
+    assert set(candidates["id"]) == {"fiji1243", "samo1305"}
+
+
+def test_level_filter():
+    location = (2.5, 48.4)
+    assert set(geo_filter_glottocodes(location, 500, "language")["id"]) == {"stan1290", "pica1241"}
+    assert set(geo_filter_glottocodes(location, 500, "dialect")["id"]) == {"norm1245"}
+    assert set(geo_filter_glottocodes(location, 500, "family")["id"]) == {"roma1334"}
+
+    with pytest.raises(ValueError):
+        geo_filter_glottocodes(location, 500, "macrolanguage")
@@ -0,0 +1,21 @@
+import pytest
+
+import guess_glottocode.utils as utils
+
+pytestmark = pytest.mark.usefixtures("glottolog")
+
+
+def test_csv_engines_agree(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    lookup_path = tmp_path / "languoid.csv"
+
+    monkeypatch.setattr(utils, "CSV_ENGINE", "pyarrow")
+    with_pyarrow = utils.build_glottolog(lookup_path)
+    monkeypatch.setattr(utils, "CSV_ENGINE", "c")
+    without_pyarrow = utils.build_glottolog(lookup_path)
+
+    assert with_pyarrow.dtypes.equals(without_pyarrow.dtypes)
+    # DataFrame.equals treats None and NaN as equal, so compare the missing values themselves
+    for column in ("parent_id", "family_id", "iso639P3code"):
+        assert [type(v) for v in with_pyarrow[column]] == [type(v) for v in without_pyarrow[column]]
+
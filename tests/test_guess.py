@@ -15,12 +15,10 @@ candidate_glottocodes = geo_filter_glottocodes(language_location = france,
                                                buffer = 500,
                                                level = "language")
 
-glottocode_gemini = llm.guess_glottocode(language = language,
-                                         candidates=candidate_glottocodes,
-                                         api="gemini")
-
-glottocode_anthropic = llm.guess_glottocode(language = language,
-                                            candidates=candidate_glottocodes,
-                                            api = "anthropic")
+glottocodes_llm = llm.guess_glottocodes(language = language,
+                                        candidates=candidate_glottocodes,
+                                        apis = ("gemini", "anthropic"))
+glottocode_gemini = glottocodes_llm["gemini"]
+glottocode_anthropic = glottocodes_llm["anthropic"]
 
 verify = verify_glottocode_guess(language, glottocode_gemini)
@@ -0,0 +1,85 @@
+from collections import Counter
+from functools import partial
+
+import httpx
+import pytest
+import requests
+
+import guess_glottocode.utils as utils
+from guess_glottocode.utils import verify_glottocode_guess, verify_many
+
+pytestmark = pytest.mark.usefixtures("glottolog")
+
+MD_INI = {
+    "stan1290": "[core]\nname = French\n\n[altnames]\nmulti =\n    Français\n",
+    "stan1295": "[core]\nname = German\n",
+}
+
+# Glottocodes whose md.ini requests fail with a server error
+FAILING = {"pica1241"}
+
+
+def md_ini_response(url: str) -> tuple[int, str]:
+    """Return the status code and body GitHub would serve for an md.ini URL."""
+    glottocode = url.rstrip("/").split("/")[-2]
+    if glottocode in FAILING:
+        return 500, "Internal Server Error"
+    if glottocode in MD_INI:
+        return 200, MD_INI[glottocode]
+    return 404, "404: Not Found"
+
+
+@pytest.fixture
+def requested(monkeypatch):
+    """Serve md.ini files from MD_INI for both HTTP clients and count the requests per Glottocode."""
+    requested = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested[request.url.path.split("/")[-2]] += 1
+        status_code, text = md_ini_response(str(request.url))
+        return httpx.Response(status_code, text=text)
+
+    def get(url: str) -> requests.Response:
+        requested[url.split("/")[-2]] += 1
+        response = requests.Response()
+        response.url = url
+        response.status_code, text = md_ini_response(url)
+        response._content = text.encode()
+        return response
+
+    monkeypatch.setattr(
+        utils.httpx, "AsyncClient", partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(utils.HTTP_SESSION, "get", get)
+    return requested
+
+
+def test_verify_many(requested):
+    pairs = [
+        ("French", "stan1290"),
+        ("Français", "stan1290"),
+        ("German", "stan1290"),
+        ("Norman", "norm1245"),  # 404
+        ("Picard", "pica1241"),  # 500
+        ("German", None),
+    ]
+    assert verify_many(pairs) == [True, True, False, False, False, False]
+
+    # Each distinct Glottocode is fetched once; None is never fetched
+    assert requested == {"stan1290": 1, "norm1245": 1, "pica1241": 1}
+
+
+def test_verify_many_fills_shared_names_cache(requested):
+    assert verify_many([("German", "stan1295"), ("Picard", "pica1241")]) == [True, False]
+
+    # Found names are cached for the sync path, failed requests are not cached
+    assert utils._GLOTTOLOG_NAMES_CACHE == {"stan1295": frozenset({"german"})}
+    assert verify_glottocode_guess("German", "stan1295")
+    assert requested["stan1295"] == 1
+
+
+def test_verify_glottocode_guess_reports_failures(requested):
+    assert verify_glottocode_guess("French", "stan1290")
+    assert not verify_glottocode_guess("Norman", "norm1245")
+    assert not verify_glottocode_guess("Picard", "pica1241")
+    assert not verify_glottocode_guess("German", None)